@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2024 ESP32-MicroCSI Contributors
+# SPDX-License-Identifier: MIT
+
+"""
+MicroPython ESP32 CSI Module - Analysis Helpers
+
+Amplitude, phase and per-frame statistics for CSI data, compiled with the
+native/viper code emitters. Used by example_csi_analysis.py; precompile
+with mpy-cross for faster loading (./scripts/run_example.sh does this
+automatically when mpy-cross is available):
+
+    mpy-cross -O3 -march=xtensawin csi_analysis.py
+"""
+
+import math
+import array
+
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    # CPython (development): the code emitters are MicroPython compiler
+    # directives, so run the decorated functions as plain Python instead
+    class micropython:
+        @staticmethod
+        def native(f):
+            return f
+
+        @staticmethod
+        def viper(f):
+            return f
+
+    def const(x):
+        return x
+
+    ptr8 = ptr16 = ptr32 = None
+
+# Maximum number of subcarriers per frame (CSI_MAX_DATA_LEN / 2 I/Q bytes)
+MAX_SUBCARRIERS = const(256)
+
+# Scratch buffers, allocated once and reused per frame: squared amplitudes
+# for the kernel, and the default outputs of calculate_amplitude/_phase
+_AMP_BUF = array.array('i', [0] * MAX_SUBCARRIERS)
+_AMP = array.array('f', [0.0] * MAX_SUBCARRIERS)
+_PHASE = array.array('f', [0.0] * MAX_SUBCARRIERS)
+
+# Square of every int8 value, indexed by its raw (unsigned) byte
+_SQ = array.array('H', [((b - 256) if b > 127 else b) ** 2 for b in range(256)])
+
+# src is the raw I/Q buffer (the array('b') from csi_read(), or any other
+# contiguous bytes-like object); ptr8 reads it in place without creating
+# a Python int per sample.
+@micropython.viper
+def _amp_sq(src: ptr8, dst: ptr32, n: int, sq: ptr16) -> int:
+    """Write |I + jQ|^2 of n int8 I/Q pairs from src into dst, return the sum"""
+    total = 0
+    # Unrolled by 4 subcarriers (8 bytes), then the remaining 0-3
+    n4 = n & ~3
+    for i in range(0, n4, 4):
+        j = 2 * i
+        p0 = int(sq[src[j]]) + int(sq[src[j + 1]])
+        p1 = int(sq[src[j + 2]]) + int(sq[src[j + 3]])
+        p2 = int(sq[src[j + 4]]) + int(sq[src[j + 5]])
+        p3 = int(sq[src[j + 6]]) + int(sq[src[j + 7]])
+        dst[i] = p0
+        dst[i + 1] = p1
+        dst[i + 2] = p2
+        dst[i + 3] = p3
+        total += p0 + p1 + p2 + p3
+    for i in range(n4, n):
+        p = int(sq[src[2 * i]]) + int(sq[src[2 * i + 1]])
+        dst[i] = p
+        total += p
+    return total
+
+@micropython.native
+def calculate_amplitude(csi_data, out=_AMP, _sqrt=math.sqrt):
+    """Write amplitudes of complex CSI data (I, Q pairs) into out, return count"""
+    n = min(len(csi_data) // 2, len(out), MAX_SUBCARRIERS)
+    _amp_sq(csi_data, _AMP_BUF, n, _SQ)
+    for k in range(n):
+        out[k] = _sqrt(_AMP_BUF[k])
+    return n
+
+_HALF_PI = math.pi / 2
+
+def _atan2_fast(y, x):
+    """Approximate math.atan2(y, x) to within ~1e-5 rad"""
+    ax = abs(x)
+    ay = abs(y)
+    if ax >= ay:
+        if ax == 0:
+            return 0.0
+        z = ay / ax
+        swap = False
+    else:
+        z = ax / ay
+        swap = True
+    # First-octant minimax polynomial (Abramowitz & Stegun 4.4.49)
+    z2 = z * z
+    a = z * (0.9998660 + z2 * (-0.3302995 + z2 * (0.1801410 +
+             z2 * (-0.0851330 + z2 * 0.0208351))))
+    if swap:
+        a = _HALF_PI - a
+    if x < 0:
+        a = math.pi - a
+    if y < 0:
+        a = -a
+    return a
+
+@micropython.native
+def calculate_phase(csi_data, out=_PHASE, max_n=None, _atan2=_atan2_fast):
+    """Write phases of complex CSI data (I, Q pairs) into out, return count"""
+    # I/Q data is even-length; round down once instead of checking i+1
+    n = min(len(csi_data) // 2, len(out))
+    if max_n is not None and max_n < n:
+        n = max_n
+    for k in range(n):
+        out[k] = _atan2(csi_data[2 * k + 1], csi_data[2 * k])
+    return n
+
+@micropython.native
+def analyze_frame(frame, _sqrt=math.sqrt):
+    """Perform statistical analysis on CSI frame"""
+    csi_data = frame['data']
+    n = min(len(csi_data) // 2, MAX_SUBCARRIERS)
+    
+    if n == 0:
+        return None
+    
+    # Stats are taken on the power |z|^2 = a^2 so no per-subcarrier sqrt
+    # is needed. The kernel returns the exact integer power sum; a second,
+    # mean-centred pass then gives a stable variance and the extremes.
+    mean = _amp_sq(csi_data, _AMP_BUF, n, _SQ) / n
+    var_sum = 0.0
+    max_p = _AMP_BUF[0]
+    min_p = max_p
+    for k in range(n):
+        p = _AMP_BUF[k]
+        if p > max_p:
+            max_p = p
+        elif p < min_p:
+            min_p = p
+        d = p - mean
+        var_sum += d * d
+    
+    # 'avg' is the RMS amplitude and 'std' the standard deviation of the
+    # per-subcarrier power; max/min are exact amplitudes
+    return {
+        'avg': _sqrt(mean),
+        'max': _sqrt(max_p),
+        'min': _sqrt(min_p),
+        'std': _sqrt(var_sum / n),
+        'subcarriers': n
+    }
@@ -13,7 +13,12 @@ This example demonstrates CSI data analysis including:
 
 import network
 import time
-import math
+import array
+import asyncio
+import struct
+from collections import deque
+
+from csi_analysis import analyze_frame, calculate_phase
 
 # Import WiFi credentials
 try:
@@ -23,64 +28,189 @@ except ImportError:
     print("Please run this script using: ./scripts/run_example.sh <SSID> <PASSWORD>")
     raise
 
-def calculate_amplitude(csi_data):
-    """Calculate amplitude from complex CSI data (I, Q pairs)"""
-    amplitudes = []
-    for i in range(0, len(csi_data), 2):
-        real = csi_data[i]
-        imag = csi_data[i+1] if i+1 < len(csi_data) else 0
-        amplitude = math.sqrt(real**2 + imag**2)
-        amplitudes.append(amplitude)
-    return amplitudes
-
-def calculate_phase(csi_data):
-    """Calculate phase from complex CSI data (I, Q pairs)"""
-    phases = []
-    for i in range(0, len(csi_data), 2):
-        real = csi_data[i]
-        imag = csi_data[i+1] if i+1 < len(csi_data) else 0
-        phase = math.atan2(imag, real)
-        phases.append(phase)
-    return phases
-
-def analyze_frame(frame):
-    """Perform statistical analysis on CSI frame"""
-    csi_data = frame['data']
-    
-    # Calculate amplitudes
-    amplitudes = calculate_amplitude(csi_data)
-    
-    if not amplitudes:
-        return None
-    
-    # Statistical measures
-    avg_amplitude = sum(amplitudes) / len(amplitudes)
-    max_amplitude = max(amplitudes)
-    min_amplitude = min(amplitudes)
-    
-    # Variance
-    variance = sum((a - avg_amplitude)**2 for a in amplitudes) / len(amplitudes)
-    std_dev = math.sqrt(variance)
-    
-    return {
-        'avg': avg_amplitude,
-        'max': max_amplitude,
-        'min': min_amplitude,
-        'std': std_dev,
-        'subcarriers': len(amplitudes)
-    }
-
-def log_to_file(filename, frame, analysis):
-    """Log frame data to file"""
+# Analyze and display every Nth frame, but no more often than every
+# PRINT_INTERVAL_MS so the console (UART) never limits the capture rate;
+# the other frames are only logged
+DISPLAY_EVERY = 10
+PRINT_INTERVAL_MS = 200
+
+# Analyze every frame so each log record carries amplitude statistics
+LOG_FULL_ANALYSIS = False
+
+# Log human-readable CSV instead of packed binary records (slower: every
+# field is formatted as text). Decode binary logs offline with
+# scripts/csi_decode.py
+LOG_HUMAN = False
+
+# Frames read from the driver but not yet analyzed (oldest dropped when full)
+FRAME_QUEUE_SIZE = 16
+
+# Binary log: LOG_MAGIC, then one fixed-size record per frame with
+# timestamp, rssi, rate, mcs, channel, mac, rms_amp, max_amp, min_amp,
+# std_power (NaN when the frame was not analyzed).
+# Must match scripts/csi_decode.py
+LOG_MAGIC = b"CSI\x01"
+LOG_RECORD_FORMAT = '<IhBBB6sffff'
+
+_NAN = float('nan')
+
+# Log records are batched in RAM and written out once this many bytes accumulate
+LOG_FLUSH_SIZE = 2048
+
+_LOG_BUF = bytearray()
+_LOG_REC = bytearray(struct.calcsize(LOG_RECORD_FORMAT))
+
+def log_to_file(frame, analysis):
+    """Append a binary record to the log buffer, return True once it is full"""
+    if analysis:
+        stats = (analysis['avg'], analysis['max'], analysis['min'], analysis['std'])
+    else:
+        stats = (_NAN, _NAN, _NAN, _NAN)
+    struct.pack_into(LOG_RECORD_FORMAT, _LOG_REC, 0, frame['timestamp'],
+                     frame['rssi'], frame['rate'], frame['mcs'],
+                     frame['channel'], frame['mac'], *stats)
+    _LOG_BUF.extend(_LOG_REC)
+    return len(_LOG_BUF) >= LOG_FLUSH_SIZE
+
+# MAC addresses formatted for the CSV log, keyed by the raw 6-byte address
+_MAC_BYTES = {}
+
+def format_mac(mac):
+    """Format a MAC address as b'aa:bb:cc:dd:ee:ff', memoized per address"""
+    mac_bytes = _MAC_BYTES.get(mac)
+    if mac_bytes is None:
+        mac_bytes = ':'.join('%02x' % b for b in mac).encode()
+        _MAC_BYTES[mac] = mac_bytes
+    return mac_bytes
+
+# CSV row templates; the MAC bytes are spliced in between the two parts
+# (bytes %s formatting differs between MicroPython and CPython)
+LOG_CSV_HEADER = b"timestamp,rssi,rate,mcs,channel,mac,rms_amp,max_amp,min_amp,std_power\n"
+_LOG_FMT_META = b"%d,%d,%d,%d,%d,"
+_LOG_FMT_STATS = b",%.2f,%.2f,%.2f,%.2f\n"
+_LOG_NO_STATS = b",,,,\n"
+
+def log_to_csv(frame, analysis):
+    """Append a CSV row to the log buffer, return True once it is full"""
+    buf = _LOG_BUF
+    buf.extend(_LOG_FMT_META % (
+        frame['timestamp'], frame['rssi'], frame['rate'], frame['mcs'],
+        frame['channel']))
+    buf.extend(format_mac(frame['mac']))
+    if analysis:
+        buf.extend(_LOG_FMT_STATS % (
+            analysis['avg'], analysis['max'], analysis['min'], analysis['std']))
+    else:
+        # Frame was not analyzed, leave the amplitude columns empty
+        buf.extend(_LOG_NO_STATS)
+    return len(buf) >= LOG_FLUSH_SIZE
+
+def flush_log(f):
+    """Write buffered log records to file"""
     try:
-        with open(filename, 'a') as f:
-            mac_str = ':'.join('%02x' % b for b in frame['mac'])
-            f.write(str(frame['timestamp']) + "," + str(frame['rssi']) + "," + str(frame['rate']) + ",")
-            f.write(str(frame['mcs']) + "," + str(frame['channel']) + "," + mac_str + ",")
-            f.write("%.2f,%.2f," % (analysis['avg'], analysis['max']))
-            f.write("%.2f,%.2f\n" % (analysis['min'], analysis['std']))
+        f.write(_LOG_BUF)
+        f.flush()
     except Exception as e:
         print("Error logging to file: " + str(e))
+    _LOG_BUF[:] = b''
+
+async def reader_task(wlan, frames, frame_ready):
+    """Move CSI frames from the driver buffer into the analysis queue"""
+    csi_read = wlan.csi_read
+    while True:
+        frame = csi_read()
+        if frame:
+            frames.append(frame)
+            frame_ready.set()
+            # Let the analyzer run between frames
+            await asyncio.sleep_ms(0)
+        else:
+            # Driver buffer empty: yield so logging can run meanwhile
+            await asyncio.sleep_ms(1)
+
+async def analyzer_task(wlan, frames, frame_ready, log_ready, stats):
+    """Analyze, display and log the queued frames"""
+    csi_available = wlan.csi_available
+    csi_dropped = wlan.csi_dropped
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    logging = log_ready is not None
+    log_frame = log_to_csv if LOG_HUMAN else log_to_file
+    phases = array.array('f', [0.0] * 5)
+    last_print = time.ticks_add(ticks_ms(), -PRINT_INTERVAL_MS)
+    
+    while True:
+        await frame_ready.wait()
+        frame_ready.clear()
+        
+        while frames:
+            frame = frames.popleft()
+            stats['frames'] += 1
+            frame_count = stats['frames']
+            
+            # Analyze only the frames that are displayed (or all of
+            # them when the log must carry amplitude statistics)
+            display = (frame_count % DISPLAY_EVERY == 0 and
+                       ticks_diff(ticks_ms(), last_print) >= PRINT_INTERVAL_MS)
+            if display:
+                last_print = ticks_ms()
+            analysis = None
+            if display or (logging and LOG_FULL_ANALYSIS):
+                analysis = analyze_frame(frame)
+            
+            # Log to file; the logger task writes the buffer once full
+            if logging and log_frame(frame, analysis):
+                log_ready.set()
+            
+            if display and analysis:
+                # Display analysis
+                print("Frame #%4d | RSSI: %3d dBm | MCS: %2d | Subcarriers: %3d | RMS: %6.2f | Power std: %8.1f" % 
+                      (frame_count, frame['rssi'], frame['mcs'], analysis['subcarriers'], 
+                       analysis['avg'], analysis['std']))
+                
+                # Calculate phases for first few subcarriers
+                n_phases = calculate_phase(frame['data'], phases)
+                phases_str = "".join("%6.3f " % phases[k] for k in range(n_phases))
+                
+                # Throughput
+                elapsed = ticks_diff(ticks_ms(), stats['start']) / 1000.0
+                fps = frame_count / elapsed if elapsed > 0 else 0
+                
+                print("\n"
+                      "  Detailed Analysis (Frame #%d):\n"
+                      "    RMS Amplitude:     %.2f\n"
+                      "    Max Amplitude:     %.2f\n"
+                      "    Min Amplitude:     %.2f\n"
+                      "    Power Std Dev:     %.2f\n"
+                      "    Subcarriers:       %d\n"
+                      "    First 5 phases:    %s\n"
+                      "    Buffer status:     %d available, %d dropped\n"
+                      "    Throughput:        %.1f frames/sec\n" %
+                      (frame_count, analysis['avg'], analysis['max'],
+                       analysis['min'], analysis['std'],
+                       analysis['subcarriers'], phases_str,
+                       csi_available(), csi_dropped(), fps))
+            
+            await asyncio.sleep_ms(0)
+
+async def logger_task(log_file, log_ready):
+    """Write the log buffer out whenever the analyzer fills it"""
+    while True:
+        await log_ready.wait()
+        log_ready.clear()
+        flush_log(log_file)
+
+async def capture(wlan, log_file, stats):
+    """Run the reader, analyzer and (optional) logger tasks"""
+    frames = deque((), FRAME_QUEUE_SIZE)
+    frame_ready = asyncio.Event()
+    log_ready = asyncio.Event() if log_file else None
+    
+    tasks = [reader_task(wlan, frames, frame_ready),
+             analyzer_task(wlan, frames, frame_ready, log_ready, stats)]
+    if log_file:
+        tasks.append(logger_task(log_file, log_ready))
+    await asyncio.gather(*tasks)
 
 def main():
     # Initialize WiFi in station mode
@@ -136,73 +266,26 @@ def main():
     print()
     
     # Initialize logging
-    log_filename = "csi_log.csv"
+    log_filename = "csi_log.csv" if LOG_HUMAN else "csi_log.bin"
+    log_file = None
     try:
-        with open(log_filename, 'w') as f:
-            f.write("timestamp,rssi,rate,mcs,channel,mac,avg_amp,max_amp,min_amp,std_dev\n")
+        log_file = open(log_filename, 'wb')
+        log_file.write(LOG_CSV_HEADER if LOG_HUMAN else LOG_MAGIC)
         print("Logging to: " + log_filename)
     except Exception as e:
         print("Warning: Could not create log file: " + str(e))
         log_filename = None
+        log_file = None
     
     print()
     print("Press Ctrl+C to stop")
     print("-" * 60)
     
-    frame_count = 0
-    start_time = time.ticks_ms()
+    stats = {'frames': 0, 'start': time.ticks_ms()}
     
     try:
-        while True:
-            frame = wlan.csi_read()
-            
-            if frame:
-                frame_count += 1
-                
-                # Analyze frame
-                analysis = analyze_frame(frame)
-                
-                if analysis:
-                    # Display analysis
-                    print("Frame #%4d | RSSI: %3d dBm | MCS: %2d | Subcarriers: %3d | Avg: %6.2f | Std: %6.2f" % 
-                          (frame_count, frame['rssi'], frame['mcs'], analysis['subcarriers'], 
-                           analysis['avg'], analysis['std']))
-                    
-                    # Log to file
-                    if log_filename:
-                        log_to_file(log_filename, frame, analysis)
-                    
-                    # Show detailed analysis every 10 frames
-                    if frame_count % 10 == 0:
-                        print()
-                        print("  Detailed Analysis (Frame #" + str(frame_count) + "):")
-                        print("    Average Amplitude: %.2f" % analysis['avg'])
-                        print("    Max Amplitude:     %.2f" % analysis['max'])
-                        print("    Min Amplitude:     %.2f" % analysis['min'])
-                        print("    Std Deviation:     %.2f" % analysis['std'])
-                        print("    Subcarriers:       " + str(analysis['subcarriers']))
-                        
-                        # Calculate and show phases for first few subcarriers
-                        phases = calculate_phase(frame['data'][:10])
-                        print("    First 5 phases:    ", end="")
-                        for i, phase in enumerate(phases[:5]):
-                            print("%6.3f " % phase, end="")
-                        print()
-                        
-                        # Buffer statistics
-                        available = wlan.csi_available()
-                        dropped = wlan.csi_dropped()
-                        print("    Buffer status:     " + str(available) + " available, " + str(dropped) + " dropped")
-                        
-                        # Throughput
-                        elapsed = time.ticks_diff(time.ticks_ms(), start_time) / 1000.0
-                        fps = frame_count / elapsed if elapsed > 0 else 0
-                        print("    Throughput:        %.1f frames/sec" % fps)
-                        print()
-            else:
-                # No frame available
-                time.sleep(0.001)
-                
+        asyncio.run(capture(wlan, log_file, stats))
+    
     except KeyboardInterrupt:
         print("\n" + "=" * 60)
         print("Stopping...")
@@ -211,7 +294,15 @@ def main():
         # Cleanup and final statistics
         wlan.csi_disable()
         
-        elapsed = time.ticks_diff(time.ticks_ms(), start_time) / 1000.0
+        if log_file:
+            flush_log(log_file)
+            log_file.close()
+        
+        # Reset asyncio state so the example can be run again from the REPL
+        asyncio.new_event_loop()
+        
+        frame_count = stats['frames']
+        elapsed = time.ticks_diff(time.ticks_ms(), stats['start']) / 1000.0
         
         print()
         print("=" * 60)
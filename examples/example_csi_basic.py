@@ -18,6 +18,21 @@ except ImportError:
     print("Please run this script using: ./scripts/run_example.sh <SSID> <PASSWORD>")
     raise
 
+# Minimum time between frame reports; frames in between are counted but not
+# printed so the console (UART) is never what limits the capture rate
+PRINT_INTERVAL_MS = 200
+
+# Formatted MAC strings, keyed by the raw 6-byte address
+_MAC_STRS = {}
+
+def format_mac(mac):
+    """Format a MAC address as aa:bb:cc:dd:ee:ff, memoized per address"""
+    mac_str = _MAC_STRS.get(mac)
+    if mac_str is None:
+        mac_str = ':'.join('%02x' % b for b in mac)
+        _MAC_STRS[mac] = mac_str
+    return mac_str
+
 def main():
     # Initialize WiFi in station mode
     wlan = network.WLAN(network.STA_IF)
@@ -25,7 +40,7 @@ def main():
     
     print("WiFi initialized")
     mac = wlan.config('mac')
-    print("MAC address: " + ':'.join('%02x' % b for b in mac))
+    print("MAC address: " + format_mac(mac))
     
     # Configure WiFi BEFORE connecting (critical for ESP32-C6 CSI)
     print("Configuring WiFi for CSI...")
@@ -67,35 +82,44 @@ def main():
     
     frame_count = 0
     
+    # Bind methods used in the capture loop to locals
+    csi_read = wlan.csi_read
+    csi_available = wlan.csi_available
+    csi_dropped = wlan.csi_dropped
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    
+    # Report the first frame right away
+    last_print = time.ticks_add(ticks_ms(), -PRINT_INTERVAL_MS)
+    
     try:
         while True:
-            # Read CSI frame (non-blocking)
-            frame = wlan.csi_read()
+            # Read CSI frame, sleeping until one arrives (or 100 ms pass)
+            frame = csi_read(timeout_ms=100)
             
             if frame:
                 frame_count += 1
                 
-                # Display frame information
-                print("Frame #" + str(frame_count))
-                print("  RSSI:      " + str(frame['rssi']) + " dBm")
-                print("  Rate:      " + str(frame['rate']))
-                print("  MCS:       " + str(frame['mcs']))
-                print("  Channel:   " + str(frame['channel']))
-                print("  Bandwidth: " + ("40MHz" if frame['cwb'] else "20MHz"))
-                mac_str = ':'.join('%02x' % b for b in frame['mac'])
-                print("  MAC:       " + mac_str)
-                print("  CSI len:   " + str(len(frame['data'])) + " samples")
-                print("  Timestamp: " + str(frame['timestamp']) + " µs")
-                
-                # Show buffer status
-                available = wlan.csi_available()
-                dropped = wlan.csi_dropped()
-                print("  Buffer:    " + str(available) + " available, " + str(dropped) + " dropped")
-                print()
-                
-            else:
-                # No frame available, sleep briefly
-                time.sleep(0.01)
+                # Display frame information as a single write to the console,
+                # at most once every PRINT_INTERVAL_MS
+                now = ticks_ms()
+                if ticks_diff(now, last_print) < PRINT_INTERVAL_MS:
+                    continue
+                last_print = now
+                print("Frame #%d\n"
+                      "  RSSI:      %d dBm\n"
+                      "  Rate:      %d\n"
+                      "  MCS:       %d\n"
+                      "  Channel:   %d\n"
+                      "  Bandwidth: %s\n"
+                      "  MAC:       %s\n"
+                      "  CSI len:   %d samples\n"
+                      "  Timestamp: %d µs\n"
+                      "  Buffer:    %d available, %d dropped\n" %
+                      (frame_count, frame['rssi'], frame['rate'], frame['mcs'],
+                       frame['channel'], "40MHz" if frame['cwb'] else "20MHz",
+                       format_mac(frame['mac']), len(frame['data']),
+                       frame['timestamp'], csi_available(), csi_dropped()))
                 
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024 ESP32-MicroCSI Contributors
+# SPDX-License-Identifier: MIT
+#
+# Convert a binary CSI log (csi_log.bin) written by example_csi_analysis.py
+# into CSV.
+#
+# Usage:
+#   mpremote fs cp :csi_log.bin .
+#   python3 scripts/csi_decode.py csi_log.bin              # CSV to stdout
+#   python3 scripts/csi_decode.py csi_log.bin -o log.csv   # CSV to file
+
+import argparse
+import math
+import struct
+import sys
+
+# Must match LOG_MAGIC / LOG_RECORD_FORMAT in examples/example_csi_analysis.py
+LOG_MAGIC = b"CSI\x01"
+LOG_RECORD_FORMAT = '<IhBBB6sffff'
+
+CSV_HEADER = "timestamp,rssi,rate,mcs,channel,mac,rms_amp,max_amp,min_amp,std_power\n"
+
+
+def decode(src, dst):
+    """Write the records of binary log src as CSV rows to dst, return count"""
+    if src.read(len(LOG_MAGIC)) != LOG_MAGIC:
+        raise ValueError("not a CSI binary log (bad magic)")
+
+    record = struct.Struct(LOG_RECORD_FORMAT)
+    data = src.read()
+    usable = len(data) - len(data) % record.size
+    if usable != len(data):
+        print("Warning: ignoring truncated last record", file=sys.stderr)
+
+    dst.write(CSV_HEADER)
+    count = 0
+    for fields in record.iter_unpack(data[:usable]):
+        timestamp, rssi, rate, mcs, channel, mac = fields[:6]
+        stats = fields[6:]
+        row = "%d,%d,%d,%d,%d,%s," % (timestamp, rssi, rate, mcs, channel,
+                                      ':'.join('%02x' % b for b in mac))
+        if math.isnan(stats[0]):
+            # Frame was not analyzed on the device
+            row += ",,,\n"
+        else:
+            row += "%.2f,%.2f,%.2f,%.2f\n" % stats
+        dst.write(row)
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a binary CSI log to CSV")
+    parser.add_argument("input", help="binary log file (csi_log.bin)")
+    parser.add_argument("-o", "--output", help="CSV output file (default: stdout)")
+    args = parser.parse_args()
+
+    with open(args.input, 'rb') as src:
+        if args.output:
+            with open(args.output, 'w') as dst:
+                count = decode(src, dst)
+            print("Decoded %d records to %s" % (count, args.output), file=sys.stderr)
+        else:
+            decode(src, sys.stdout)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except (OSError, ValueError) as e:
+        print("Error: " + str(e), file=sys.stderr)
+        sys.exit(1)
@@ -55,6 +55,38 @@ EOF
 echo "Copying files to device..."
 mpremote connect "$PORT" fs cp examples/wifi_config.py :wifi_config.py
 
+# Copy analysis helpers, precompiled to .mpy when mpy-cross is available.
+# The mpy-cross built with the firmware is preferred so the .mpy version
+# matches; the native code architecture is read from the device itself.
+MPY_CROSS=""
+if [ -x build/micropython/mpy-cross/build/mpy-cross ]; then
+    MPY_CROSS="build/micropython/mpy-cross/build/mpy-cross"
+elif command -v mpy-cross >/dev/null 2>&1; then
+    MPY_CROSS="mpy-cross"
+fi
+
+MPY_ARCH=""
+if [ -n "$MPY_CROSS" ]; then
+    ARCH_ID=$(mpremote connect "$PORT" exec "import sys; print(sys.implementation._mpy >> 10)" | tr -d '\r')
+    case "$ARCH_ID" in
+        9)  MPY_ARCH="xtensa" ;;
+        10) MPY_ARCH="xtensawin" ;;
+        11) MPY_ARCH="rv32imc" ;;
+    esac
+fi
+
+if [ -n "$MPY_ARCH" ] && "$MPY_CROSS" -O3 -march="$MPY_ARCH" examples/csi_analysis.py -o examples/csi_analysis.mpy; then
+    echo "Copying precompiled analysis helpers ($MPY_ARCH) to device..."
+    # MicroPython imports a .py in preference to a .mpy of the same name
+    mpremote connect "$PORT" fs rm :csi_analysis.py >/dev/null 2>&1 || true
+    mpremote connect "$PORT" fs cp examples/csi_analysis.mpy :csi_analysis.mpy
+    rm -f examples/csi_analysis.mpy
+else
+    echo "Copying analysis helpers to device (mpy-cross not available)..."
+    mpremote connect "$PORT" fs rm :csi_analysis.mpy >/dev/null 2>&1 || true
+    mpremote connect "$PORT" fs cp examples/csi_analysis.py :csi_analysis.py
+fi
+
 echo "Copying example script to device..."
 mpremote connect "$PORT" fs cp examples/"$SCRIPT".py :"$SCRIPT".py
 
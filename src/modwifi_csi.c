@@ -218,8 +218,10 @@ void IRAM_ATTR wifi_csi_rx_cb(void *ctx, wifi_csi_info_t *info) {
         memcpy(frame.data, info->buf, frame.len);
     }
 
-    // Write to circular buffer
-    csi_buffer_write(&g_csi_state.buffer, &frame);
+    // Write to circular buffer and wake a csi_read() waiting for a frame
+    if (csi_buffer_write(&g_csi_state.buffer, &frame)) {
+        mp_hal_wake_main_task();
+    }
 }
 
 // ============================================================================
@@ -608,14 +610,37 @@ STATIC mp_obj_t network_wlan_csi_disable(mp_obj_t self_in) {
 MP_DEFINE_CONST_FUN_OBJ_1(network_wlan_csi_disable_obj,
     network_wlan_csi_disable);
 
-// wlan.csi_read() -> dict or None
-STATIC mp_obj_t network_wlan_csi_read(mp_obj_t self_in) {
-    (void)self_in; // WLAN object not used, CSI is global state
+// wlan.csi_read(timeout_ms=0) -> dict or None
+STATIC mp_obj_t network_wlan_csi_read(size_t n_args, const mp_obj_t *args,
+    mp_map_t *kw_args) {
+    (void)args[0]; // WLAN object not used, CSI is global state
+
+    enum { ARG_timeout_ms };
+    static const mp_arg_t allowed_args[] = {
+        {MP_QSTR_timeout_ms, MP_ARG_INT, {.u_int = 0}},
+    };
+
+    mp_arg_val_t parsed_args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args - 1, args + 1, kw_args, MP_ARRAY_SIZE(allowed_args),
+        allowed_args, parsed_args);
+    mp_int_t timeout_ms = parsed_args[ARG_timeout_ms].u_int;
 
     csi_frame_t frame;
 
-    if (!wifi_csi_read_frame(&frame)) {
-        return mp_const_none;
+    // Sleep until the CSI callback queues a frame (it wakes this task), the
+    // timeout expires, or a pending event such as Ctrl+C must be handled.
+    // timeout_ms == 0 is a non-blocking read, timeout_ms < 0 waits forever.
+    mp_uint_t start = mp_hal_ticks_ms();
+    while (!wifi_csi_read_frame(&frame)) {
+        if (timeout_ms < 0) {
+            mp_event_wait_indefinite();
+            continue;
+        }
+        mp_uint_t elapsed = mp_hal_ticks_ms() - start;
+        if (elapsed >= (mp_uint_t)timeout_ms) {
+            return mp_const_none;
+        }
+        mp_event_wait_ms(timeout_ms - elapsed);
     }
 
     // Create dictionary for frame data
@@ -665,16 +690,20 @@ STATIC mp_obj_t network_wlan_csi_read(mp_obj_t self_in) {
     mp_obj_dict_store(dict, MP_OBJ_NEW_QSTR(MP_QSTR_mac),
         mp_obj_new_bytes(frame.mac, 6));
 
-    // CSI data as array('b') - int8_t values matching ESP-IDF API
+    // CSI data as array('b') - int8_t values matching ESP-IDF API. The
+    // samples are copied into a contiguous heap buffer owned by the array:
+    // `frame` lives on this function's stack, so a by-reference array would
+    // point at freed memory once we return.
     mp_obj_array_t *csi_array =
-        MP_OBJ_TO_PTR(mp_obj_new_bytearray_by_ref(frame.len, frame.data));
+        MP_OBJ_TO_PTR(mp_obj_new_bytearray(frame.len, frame.data));
     csi_array->typecode = 'b';
     mp_obj_dict_store(dict, MP_OBJ_NEW_QSTR(MP_QSTR_data),
         MP_OBJ_FROM_PTR(csi_array));
 
     return dict;
 }
-MP_DEFINE_CONST_FUN_OBJ_1(network_wlan_csi_read_obj, network_wlan_csi_read);
+MP_DEFINE_CONST_FUN_OBJ_KW(network_wlan_csi_read_obj, 1,
+    network_wlan_csi_read);
 
 // wlan.csi_dropped() -> int
 STATIC mp_obj_t network_wlan_csi_dropped(mp_obj_t self_in) {
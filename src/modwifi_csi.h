@@ -111,7 +111,7 @@ void wifi_csi_rx_cb(void *ctx, wifi_csi_info_t *info);
 // MicroPython WLAN method objects (exposed to network_wlan.c)
 extern const mp_obj_fun_builtin_var_t network_wlan_csi_enable_obj;
 extern const mp_obj_fun_builtin_fixed_t network_wlan_csi_disable_obj;
-extern const mp_obj_fun_builtin_fixed_t network_wlan_csi_read_obj;
+extern const mp_obj_fun_builtin_var_t network_wlan_csi_read_obj;
 extern const mp_obj_fun_builtin_fixed_t network_wlan_csi_dropped_obj;
 extern const mp_obj_fun_builtin_fixed_t network_wlan_csi_available_obj;
 